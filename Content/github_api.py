@@ -1,344 +1,935 @@
-import datetime
-import time
-import traceback
-from typing import List, Union
-
-import requests
-
-# Base URL for the GitHub API
-GITHUB_BASE_URL = "https://api.github.com"
-
-# Delay between pagination requests to avoid hitting rate limits
-PAGINATION_DELAY_SECONDS = 1
-
-
-class GHContentObject:
-    """
-    Represents a content object in a GitHub repository, which can be a file or a directory.
-
-    Attributes:
-        type (str): The type of the object ('file' or 'dir').
-        name (str): The name of the content object.
-        parent (GHContentObject): The parent directory of the object.
-        children (List[GHContentObject]): List of child objects if the object is a directory.
-    """
-    def __init__(self, data: dict, parent: 'GHContentObject' = None, children: List['GHContentObject'] = None):
-        self.type = data['type']
-        self.name = data['name']
-        self.parent = parent
-        self.children = children if children is not None else []
-
-    def add_child(self, child: 'GHContentObject'):
-        """
-        Adds a single child object to the current object.
-        """
-        self.children.append(child)
-
-    def add_children(self, children: List['GHContentObject']):
-        """
-        Adds multiple child objects to the current object.
-        """
-        self.children.extend(children)
-
-
-def print_content_tree(root_objects: List[GHContentObject]):
-    """
-    Prints a visual representation of the content tree starting from the root objects.
-
-    Args:
-        root_objects (List[GHContentObject]): List of root-level content objects.
-    """
-    print()
-
-    def _print_tree(node: GHContentObject, prefix: str = "", is_last: bool = True):
-        connector = "└── " if is_last else "├── "
-        print(f"{prefix}{connector}{node.name}")
-
-        if node.type == "dir" and node.children:
-            new_prefix = prefix + ("    " if is_last else "│   ")
-            for _i, _child in enumerate(node.children):
-                _print_tree(_child, new_prefix, is_last=(_i == len(node.children) - 1))
-
-    for i, root in enumerate(root_objects):
-        print(root.name)
-        for j, child in enumerate(root.children):
-            _print_tree(child, "", is_last=(j == len(root.children) - 1))
-
-
-def pause_until_utc(until: int):
-    """
-    Pauses execution until a specified UTC timestamp.
-
-    Args:
-        until (int): The UTC timestamp to wait until.
-    """
-    while True:
-        now = datetime.datetime.now(datetime.timezone.utc)
-        if now.timestamp() >= until:
-            print()
-            return
-        else:
-            remaining = datetime.datetime.fromtimestamp(until, datetime.timezone.utc) - now
-            remaining_seconds = int(remaining.total_seconds())
-            days, remainder = divmod(remaining_seconds, 86400)  # 86400 seconds in a day
-            hours, remainder = divmod(remainder, 3600)  # 3600 seconds in an hour
-            minutes, seconds = divmod(remainder, 60)
-
-            print("\rWaiting for the rate limit to reset. Time remaining: "
-                  f"{days} day(s) {hours} hour(s) {minutes} minute(s) {seconds} second(s)",
-                  end=''
-                  )
-        time.sleep(0.5)
-
-
-def get_repo_folder(owner: str, repo: str, api_version: str, access_token: str,
-                    path: str = "") -> List[GHContentObject]:
-    """
-    Retrieves the contents of a specific folder in a GitHub repository.
-
-    Args:
-        owner (str): The owner of the repository.
-        repo (str): The repository name.
-        api_version (str): The API version to use.
-        access_token (str): The personal access token for authentication.
-        path (str): The folder path within the repository.
-
-    Returns:
-        List[GHContentObject]: List of content objects in the folder.
-    """
-    url = f"{GITHUB_BASE_URL}/repos/{owner}/{repo}/contents/{path}"
-    params = {
-        "per_page": 100,
-        "page": 1
-    }
-    headers = {
-        "X-GitHub-Api-Version": api_version,
-        "Authorization": f"Bearer {access_token}"
-    }
-
-    results = []
-
-    while True:
-        print(f"\rParsing page {params['page']} of folder {path}", end='')
-        try:
-            response = requests.get(url, headers=headers, params=params)
-
-            if not response.ok:
-                if response.status_code in [403, 429] and int(response.headers['x-ratelimit-remaining']) <= 0:
-                    print()
-                    pause_until_utc(int(response.headers['x-ratelimit-reset']))
-                elif response.status_code == 403:
-                    print(f"\nThe repository {owner}/{repo} appears to be private")
-                    return []
-                elif response.status_code == 404:
-                    print(f"\nCould not find {owner}/{repo} repository")
-                    return []
-                else:
-                    print()
-                    print(f"\nParsing error: {response.text}")
-                    return []
-            else:
-                data = response.json()
-                if len(data) <= 0:
-                    break
-                else:
-                    results.extend([GHContentObject(x) for x in data])
-        except Exception as e:
-            print()
-            print(f"An unhandled exception occurred: {e}")
-            print(traceback.format_exc())
-        return results
-
-
-def parse_repo_contents(owner: str, repo: str, api_version: str, access_token: str,
-                        path: str = "", parent_object: GHContentObject = None) -> List[GHContentObject]:
-    """
-    Recursively parses the contents of a GitHub repository, including nested directories.
-
-    Args:
-        owner (str): The owner of the repository.
-        repo (str): The repository name.
-        api_version (str): The API version to use.
-        access_token (str): The personal access token for authentication.
-        path (str): The folder path to start parsing from.
-        parent_object (GHContentObject): The parent object for nested structures.
-
-    Returns:
-        List[GHContentObject]: List of all parsed content objects.
-    """
-    results = []
-
-    folder_contents = get_repo_folder(owner, repo, api_version, access_token, path)
-
-    if parent_object is None:
-        results.extend(folder_contents)
-    else:
-        parent_object.add_children(folder_contents)
-
-    for content in folder_contents:
-        if content.type == "dir":
-            parse_repo_contents(owner, repo, api_version, access_token, f"{path}/{content.name}", content)
-
-    return results
-
-
-def get_repo_info(owner: str, repo: str, api_version: str, access_token: str) -> Union[dict, None]:
-    """
-    Retrieves metadata about a specific GitHub repository.
-
-    Args:
-        owner (str): The owner of the repository.
-        repo (str): The repository name.
-        api_version (str): The API version to use.
-        access_token (str): The personal access token for authentication.
-
-    Returns:
-        Union[dict, None]: A dictionary containing repository metadata, or None if the repository is inaccessible.
-    """
-    url = f"{GITHUB_BASE_URL}/repos/{owner}/{repo}"
-    headers = {
-        "X-GitHub-Api-Version": api_version,
-        "Authorization": f"Bearer {access_token}"
-    }
-
-    print(f"Trying to get repo {owner}/{repo}...")
-
-    try:
-        response = requests.get(url, headers=headers)
-
-        if not response.ok:
-            if response.status_code in [403, 429] and int(response.headers['x-ratelimit-remaining']) <= 0:
-                pause_until_utc(int(response.headers['x-ratelimit-reset']))
-            elif response.status_code == 403:
-                print(f"The repository {owner}/{repo} appears to be private")
-                return None
-            elif response.status_code == 404:
-                print(f"Could not find {owner}/{repo} repository")
-                return None
-            else:
-                print()
-                print(f"Parsing error: {response.text}")
-                return None
-        else:
-            return response.json()
-    except Exception as e:
-        print()
-        print(f"An unhandled exception occurred: {e}")
-        print(traceback.format_exc())
-
-
-def get_repo_commits(owner: str, repo: str, api_version: str, access_token: str, starting_page: int) -> List[dict]:
-    """
-    Retrieves a list of commits from a GitHub repository.
-
-    Args:
-        owner (str): The owner of the repository.
-        repo (str): The repository name.
-        api_version (str): The API version to use.
-        access_token (str): The personal access token for authentication.
-        starting_page (int): The page number to start retrieving commits from.
-
-    Returns:
-        List[dict]: A list of commit objects containing metadata about each commit.
-    """
-    url = f"{GITHUB_BASE_URL}/repos/{owner}/{repo}/commits"
-    params = {
-        "per_page": 100,
-        "page": starting_page
-    }
-    headers = {
-        "X-GitHub-Api-Version": api_version,
-        "Authorization": f"Bearer {access_token}"
-    }
-
-    print(f"Trying to get commits of repo {owner}/{repo}...")
-
-    results = []
-
-    while True:
-        print(f"\rParsing page {params['page']}", end='')
-        try:
-            response = requests.get(url, headers=headers, params=params)
-
-            if not response.ok:
-                if response.status_code in [403, 429] and int(response.headers['x-ratelimit-remaining']) <= 0:
-                    print()
-                    pause_until_utc(int(response.headers['x-ratelimit-reset']))
-                elif response.status_code == 403:
-                    print(f"\nThe repository {owner}/{repo} appears to be private")
-                    return []
-                elif response.status_code == 404:
-                    print(f"\nCould not find {owner}/{repo} repository")
-                    return []
-                else:
-                    print()
-                    print(f"\nParsing error: {response.text}")
-                    return []
-            else:
-                data = response.json()
-                if len(data) <= 0:
-                    break
-                else:
-                    results += data
-        except Exception as e:
-            print()
-            print(f"An unhandled exception occurred: {e}")
-            print(traceback.format_exc())
-        return results
-
-
-def search_repos(keywords: List[str], api_version: str, access_token: str, starting_page: int = 1) -> List[dict]:
-    """
-    Searches for GitHub repositories based on a list of keywords.
-
-    Args:
-        keywords (List[str]): A list of keywords to search for.
-        api_version (str): The API version to use.
-        access_token (str): The personal access token for authentication.
-        starting_page (int): The page number to start the search from.
-
-    Returns:
-        List[dict]: A list of repository objects matching the search criteria.
-    """
-    url = f"{GITHUB_BASE_URL}/search/repositories"
-    params = {
-        "q": '+'.join(keywords),
-        "per_page": 100,
-        "page": starting_page
-    }
-    headers = {
-        "X-GitHub-Api-Version": api_version,
-        "Authorization": f"Bearer {access_token}"
-    }
-    results = []
-
-    print(f"Starting search for keywords {', '.join(keywords)}")
-
-    while params['page'] <= 10:  # Limit to the first 10 pages of results
-        print(f"\rParsing page {params['page']}/10...", end='')
-        try:
-            response = requests.get(url, params=params, headers=headers)
-
-            if not response.ok:
-                if response.status_code in [403, 429] and int(response.headers['x-ratelimit-remaining']) <= 0:
-                    print()
-                    pause_until_utc(int(response.headers['x-ratelimit-reset']))
-                elif response.status_code == 422:  # Invalid search query
-                    break
-                else:
-                    print()
-                    print(f"Parsing error: {response.text}")
-                    break
-            elif len(response.json()['items']) <= 0:
-                break
-            results += response.json()['items']
-            params['page'] += 1
-        except Exception as e:
-            print()
-            print(f"An unhandled exception occurred: {e}")
-            print(traceback.format_exc())
-        time.sleep(PAGINATION_DELAY_SECONDS)
-    print()
-
-    return results
-
+import asyncio
+import atexit
+import datetime
+import os
+import shelve
+import sys
+import time
+import traceback
+import urllib.parse
+import weakref
+from collections import namedtuple
+from typing import List, Tuple, Union
+
+import httpx
+import orjson
+
+# Base URL for the GitHub API
+GITHUB_BASE_URL = "https://api.github.com"
+
+# On-disk cache of ETags and response bodies for conditional requests
+ETAG_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".github_api_cache")
+
+# Upper bound on the delay between pagination requests
+PAGINATION_DELAY_SECONDS = 1
+
+# Maximum number of API requests allowed in flight at the same time
+MAX_CONCURRENT_REQUESTS = 10
+
+# Minimum time between progress-line repaints
+PROGRESS_INTERVAL_SECONDS = 0.25
+
+# Projections of the fields actually consumed from search and commit payloads;
+# keeping these instead of the raw API dicts cuts the live heap considerably
+RepoSummary = namedtuple("RepoSummary", "full_name description stars forks html_url")
+CommitSummary = namedtuple("CommitSummary", "message author_name date html_url")
+
+# Per-column tree-drawing segments: a continuing vertical bar or blank space
+BRANCH = "│   "
+SPACE = "    "
+
+
+class GHContentObject:
+    """
+    Represents a content object in a GitHub repository, which can be a file or a directory.
+
+    Attributes:
+        type (str): The type of the object ('file' or 'dir').
+        name (str): The name of the content object.
+        parent (GHContentObject): The parent directory of the object.
+        children (List[GHContentObject]): List of child objects if the object is a directory.
+    """
+    __slots__ = ("type", "name", "_parent", "children", "__weakref__")
+
+    def __init__(self, data: dict, parent: 'GHContentObject' = None, children: List['GHContentObject'] = None):
+        self.type = data['type']
+        self.name = data['name']
+        # Held weakly: the parent already owns the child through `children`,
+        # and a strong back-reference would cycle every node through the GC.
+        self._parent = weakref.ref(parent) if parent is not None else None
+        self.children = children if children is not None else []
+
+    @property
+    def parent(self) -> Union['GHContentObject', None]:
+        """
+        The parent directory of the object, or None for root-level objects.
+        """
+        return self._parent() if self._parent is not None else None
+
+    def add_child(self, child: 'GHContentObject'):
+        """
+        Adds a single child object to the current object.
+        """
+        self.children.append(child)
+
+    def add_children(self, children: List['GHContentObject']):
+        """
+        Adds multiple child objects to the current object.
+        """
+        self.children.extend(children)
+
+
+def print_content_tree(root_objects: List[GHContentObject]):
+    """
+    Prints a visual representation of the content tree starting from the root objects.
+
+    Walks the tree iteratively and writes all lines in a single stdout call,
+    so a 50k-entry repository costs one write syscall instead of one per line.
+
+    Args:
+        root_objects (List[GHContentObject]): List of root-level content objects.
+    """
+    out = [""]
+    stack = []
+    # Prefixes keyed by the tuple of active columns (True = vertical bar), so
+    # each distinct prefix string is materialized once and shared by siblings.
+    prefixes = {(): ""}
+
+    for root in root_objects:
+        out.append(root.name)
+        for j in range(len(root.children) - 1, -1, -1):
+            stack.append((root.children[j], (), j == len(root.children) - 1))
+
+        while stack:
+            node, cols, is_last = stack.pop()
+            prefix = prefixes[cols]
+            connector = "└── " if is_last else "├── "
+            out.append(f"{prefix}{connector}{node.name}")
+
+            if node.type == "dir" and node.children:
+                child_cols = cols + (not is_last,)
+                if child_cols not in prefixes:
+                    prefixes[child_cols] = prefix + (SPACE if is_last else BRANCH)
+                # Push in reverse so popping yields the children in order.
+                for j in range(len(node.children) - 1, -1, -1):
+                    stack.append((node.children[j], child_cols, j == len(node.children) - 1))
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+async def pause_until_utc(until: int):
+    """
+    Pauses execution until a specified UTC timestamp.
+
+    Args:
+        until (int): The UTC timestamp to wait until.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    remaining = until - now.timestamp()
+    if remaining > 0:
+        reset_at = datetime.datetime.fromtimestamp(until, datetime.timezone.utc)
+        print(f"Waiting {remaining:.0f} second(s) for the rate limit to reset at {reset_at.isoformat()}")
+        await asyncio.sleep(remaining)
+    print()
+
+
+_last_progress = [0.0]
+
+
+def _print_progress(message: str):
+    """
+    Repaints the in-place progress line, at most once per PROGRESS_INTERVAL_SECONDS.
+
+    When pages are answered from the ETag cache in microseconds, an unthrottled
+    update per page would spend more time on terminal writes than on the work;
+    a raw stdout write also skips print()'s separator handling and locking.
+
+    Args:
+        message (str): The progress message to display.
+    """
+    now = time.monotonic()
+    if now - _last_progress[0] >= PROGRESS_INTERVAL_SECONDS:
+        _last_progress[0] = now
+        sys.stdout.write(f"\r{message}")
+        sys.stdout.flush()
+
+
+def _cache_key(url: str, params: dict) -> str:
+    """
+    Builds a stable cache key from a URL and its query parameters.
+
+    Args:
+        url (str): The request URL.
+        params (dict): Query parameters for the request.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"{url}?{urllib.parse.urlencode(sorted(params.items()))}"
+
+
+def _rate_limit_delay(response_headers: dict) -> float:
+    """
+    Computes an adaptive delay before the next request from rate-limit headers.
+
+    Self-paces pagination to the remaining budget: with plenty of requests left
+    the delay approaches zero, and as the budget thins out it stretches towards
+    the reset time, capped at PAGINATION_DELAY_SECONDS.
+
+    Args:
+        response_headers (dict): Headers of the last API response.
+
+    Returns:
+        float: Seconds to wait before issuing the next request.
+    """
+    try:
+        remaining = int(response_headers.get('x-ratelimit-remaining', ''))
+        reset = int(response_headers.get('x-ratelimit-reset', ''))
+    except ValueError:
+        return PAGINATION_DELAY_SECONDS
+    reset_in = max(0.0, reset - time.time())
+    if remaining <= 0:
+        return reset_in
+    return min(float(PAGINATION_DELAY_SECONDS), reset_in / remaining)
+
+
+def _last_page_from_link(link_header: str) -> int:
+    """
+    Extracts the last page number from a paginated response's Link header.
+
+    Args:
+        link_header (str): The raw Link header value (may be empty).
+
+    Returns:
+        int: The last page number, or 1 if the header carries no rel="last" entry.
+    """
+    for part in link_header.split(','):
+        if 'rel="last"' in part:
+            target = part[part.index('<') + 1:part.index('>')]
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(target).query)
+            if 'page' in query:
+                return int(query['page'][0])
+    return 1
+
+
+def _summarize_repos(items: List[dict]) -> List[RepoSummary]:
+    """
+    Projects raw search-result items down to the fields the menu actually uses.
+
+    Args:
+        items (List[dict]): Repository objects from the search API.
+
+    Returns:
+        List[RepoSummary]: One summary tuple per repository.
+    """
+    return [RepoSummary(x['full_name'], x.get('description'), x['stargazers_count'],
+                        x['forks_count'], x['html_url']) for x in items]
+
+
+def _summarize_commits(items: List[dict]) -> List[CommitSummary]:
+    """
+    Projects raw commit objects down to the fields the menu actually uses.
+
+    Args:
+        items (List[dict]): Commit objects from the commits API.
+
+    Returns:
+        List[CommitSummary]: One summary tuple per commit.
+    """
+    return [CommitSummary(x['commit']['message'], x['commit']['author']['name'],
+                          x['commit']['author']['date'], x['html_url']) for x in items]
+
+
+def _build_content_tree(entries: List[dict]) -> Tuple[List[GHContentObject], dict]:
+    """
+    Builds a GHContentObject tree from the flat path list returned by the Git Trees API.
+
+    Args:
+        entries (List[dict]): Tree entries with 'path' and 'type' ('blob' or 'tree') keys,
+            ordered so that parent directories precede their contents.
+
+    Returns:
+        Tuple[List[GHContentObject], dict]: List of root-level content objects, and an
+        index mapping full path (e.g. "a/b/c.py") to its content object.
+    """
+    roots = []
+    directories = {}
+    index = {}
+
+    for entry in entries:
+        entry_path = entry['path']
+        content_type = "dir" if entry['type'] == "tree" else "file"
+        parent_path, _, name = entry_path.rpartition('/')
+        parent = directories.get(parent_path)
+
+        obj = GHContentObject({"type": content_type, "name": name}, parent)
+        if parent is None:
+            roots.append(obj)
+        else:
+            parent.add_child(obj)
+
+        index[entry_path] = obj
+        if content_type == "dir":
+            directories[entry_path] = obj
+
+    return roots, index
+
+
+# Fetches repository metadata and the default-branch commit count in one query
+_REPO_OVERVIEW_QUERY = """
+query ($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    description
+    stargazerCount
+    forkCount
+    url
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history {
+            totalCount
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class GitHubClient:
+    """
+    Client for the GitHub REST and GraphQL APIs.
+
+    Owns the invariants that every call used to rebuild: the request headers,
+    the persistent HTTP session (and the event loop it runs on), the on-disk
+    ETag cache, and the in-memory repository-metadata cache. One instance is
+    meant to live for the whole process so connections to api.github.com stay
+    warm between calls.
+
+    Attributes:
+        base_url (str): Base URL of the GitHub API.
+        api_version (str): The API version sent with every request.
+    """
+
+    def __init__(self, api_version: str, access_token: str, base_url: str = GITHUB_BASE_URL):
+        self.base_url = base_url
+        self.api_version = api_version
+        self._headers = {
+            "X-GitHub-Api-Version": api_version,
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/vnd.github+json",
+        }
+        self._event_loop = None
+        self._session = None
+        self._semaphore = None
+        self._etag_cache = None
+        self._repo_info_cache = {}
+        atexit.register(self.close)
+
+    def close(self):
+        """
+        Closes the HTTP session and the ETag cache; also runs at interpreter shutdown.
+        """
+        if self._session is not None and not self._session.is_closed:
+            self._get_event_loop().run_until_complete(self._session.aclose())
+        if self._etag_cache is not None:
+            self._etag_cache.close()
+            self._etag_cache = None
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns the persistent event loop all of this client's calls run on.
+
+        Returns:
+            asyncio.AbstractEventLoop: The client's event loop.
+        """
+        if self._event_loop is None:
+            self._event_loop = asyncio.new_event_loop()
+        return self._event_loop
+
+    def _run(self, coro):
+        """
+        Runs a coroutine to completion on the persistent event loop.
+        """
+        return self._get_event_loop().run_until_complete(coro)
+
+    async def _ensure_client(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """
+        Lazily creates the shared HTTP client and concurrency semaphore.
+
+        The client negotiates HTTP/2, so concurrent page fetches are multiplexed
+        as streams over a single TCP+TLS connection, and keeps that connection
+        alive between calls: the DNS lookup and TLS handshake are paid once per
+        process instead of once per request.
+
+        Returns:
+            Tuple[httpx.AsyncClient, asyncio.Semaphore]: The shared client and
+            the semaphore bounding concurrent requests.
+        """
+        if self._session is None or self._session.is_closed:
+            limits = httpx.Limits(max_keepalive_connections=2 * MAX_CONCURRENT_REQUESTS,
+                                  max_connections=2 * MAX_CONCURRENT_REQUESTS)
+            self._session = httpx.AsyncClient(http2=True, timeout=30.0, limits=limits)
+            self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        return self._session, self._semaphore
+
+    def _get_etag_cache(self) -> shelve.Shelf:
+        """
+        Lazily opens the on-disk ETag cache shared by all API requests.
+
+        Returns:
+            shelve.Shelf: A mapping of cache key -> (etag, json_body, link_header).
+        """
+        if self._etag_cache is None:
+            self._etag_cache = shelve.open(ETAG_CACHE_FILE)
+        return self._etag_cache
+
+    async def _fetch(self, url: str, params: dict,
+                     repo_label: str = "") -> Union[Tuple[Union[dict, list], httpx.Headers], None]:
+        """
+        Performs a single GET request against the GitHub API, handling errors and rate limits.
+
+        Waits for the rate limit window to reset and retries when the primary rate
+        limit is exhausted; concurrency is bounded by the client's semaphore. Sends
+        If-None-Match with the last known ETag for the URL and answers a
+        304 Not Modified from the on-disk cache, which GitHub does not count
+        against the rate limit.
+
+        Args:
+            url (str): The URL to request.
+            params (dict): Query parameters for the request.
+            repo_label (str): An "owner/repo" label used in error messages, if applicable.
+
+        Returns:
+            Union[Tuple[Union[dict, list], httpx.Headers], None]: A
+            (json_body, response_headers) tuple on success, or None if the
+            request failed.
+        """
+        session, semaphore = await self._ensure_client()
+        cache = self._get_etag_cache()
+        key = _cache_key(url, params)
+        cached = cache.get(key)
+
+        request_headers = self._headers
+        if cached is not None:
+            request_headers = dict(self._headers)
+            request_headers["If-None-Match"] = cached[0]
+
+        while True:
+            async with semaphore:
+                response = await session.get(url, params=params, headers=request_headers)
+                if response.status_code == 304 and cached is not None:
+                    # httpx.Headers matches case-insensitively, which also covers
+                    # the 'Link' lookups done by the pagination callers.
+                    response_headers = httpx.Headers(response.headers)
+                    if 'link' not in response_headers and cached[2]:
+                        response_headers['link'] = cached[2]
+                    return cached[1], response_headers
+                if response.is_error:
+                    retry_after = response.headers.get('Retry-After')
+                    if response.status_code in [403, 429] and retry_after:
+                        # Secondary (abuse) rate limit: back off for as long as asked.
+                        print(f"\nSecondary rate limit hit; retrying in {retry_after} second(s)")
+                        await asyncio.sleep(int(retry_after))
+                        continue
+                    elif response.status_code in [403, 429] and int(response.headers['x-ratelimit-remaining']) <= 0:
+                        print()
+                        await pause_until_utc(int(response.headers['x-ratelimit-reset']))
+                        continue
+                    elif response.status_code == 403 and repo_label:
+                        print(f"\nThe repository {repo_label} appears to be private")
+                        return None
+                    elif response.status_code == 404 and repo_label:
+                        print(f"\nCould not find {repo_label} repository")
+                        return None
+                    elif response.status_code == 422:  # Invalid search query
+                        return None
+                    else:
+                        # Log only the status and a short body prefix; decoding a
+                        # multi-KB error body per failed request adds up in storms.
+                        snippet = response.content[:200].decode('utf-8', errors='replace')
+                        print()
+                        print(f"\nParsing error: HTTP {response.status_code}: {snippet}")
+                        return None
+                else:
+                    body = orjson.loads(response.content)
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        cache[key] = (etag, body, response.headers.get('Link', ''))
+                    return body, response.headers
+
+    def gql_query(self, query: str, variables: dict) -> Union[dict, None]:
+        """
+        Runs a query against the GitHub GraphQL API.
+
+        Args:
+            query (str): The GraphQL query document.
+            variables (dict): Variables referenced by the query.
+
+        Returns:
+            Union[dict, None]: The 'data' section of the response, or None if the
+            query failed.
+        """
+        return self._run(self._gql_query(query, variables))
+
+    async def _gql_query(self, query: str, variables: dict) -> Union[dict, None]:
+        """
+        Runs a GraphQL query, handling errors and rate limits.
+
+        Args:
+            query (str): The GraphQL query document.
+            variables (dict): Variables referenced by the query.
+
+        Returns:
+            Union[dict, None]: The 'data' section of the response, or None if the
+            query failed.
+        """
+        session, semaphore = await self._ensure_client()
+        url = f"{self.base_url}/graphql"
+
+        try:
+            while True:
+                async with semaphore:
+                    response = await session.post(url, json={"query": query, "variables": variables},
+                                                  headers=self._headers)
+                    if response.is_error:
+                        retry_after = response.headers.get('Retry-After')
+                        if response.status_code in [403, 429] and retry_after:
+                            print(f"\nSecondary rate limit hit; retrying in {retry_after} second(s)")
+                            await asyncio.sleep(int(retry_after))
+                            continue
+                        elif response.status_code in [403, 429] and int(response.headers['x-ratelimit-remaining']) <= 0:
+                            print()
+                            await pause_until_utc(int(response.headers['x-ratelimit-reset']))
+                            continue
+                        else:
+                            snippet = response.content[:200].decode('utf-8', errors='replace')
+                            print()
+                            print(f"\nParsing error: HTTP {response.status_code}: {snippet}")
+                            return None
+                    body = orjson.loads(response.content)
+                    if body.get('errors'):
+                        print(f"\nGraphQL error: {body['errors'][0].get('message')}")
+                        return None
+                    return body.get('data')
+        except Exception as e:
+            print()
+            print(f"An unhandled exception occurred: {e}")
+            print(traceback.format_exc())
+            return None
+
+    def get_repo_overview(self, owner: str, repo: str) -> Union[dict, None]:
+        """
+        Retrieves repository metadata and its commit count in a single round trip.
+
+        Uses the GraphQL API, which answers in one request what would otherwise
+        cost a metadata fetch plus a paginated commit listing over REST.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+
+        Returns:
+            Union[dict, None]: A dictionary with 'full_name', 'description', 'stars',
+            'forks', 'url' and 'commit_count' keys, or None if the repository is
+            inaccessible.
+        """
+        data = self.gql_query(_REPO_OVERVIEW_QUERY, {"owner": owner, "name": repo})
+        if not data or not data.get('repository'):
+            return None
+
+        repository = data['repository']
+        branch_ref = repository.get('defaultBranchRef') or {}
+        history = (branch_ref.get('target') or {}).get('history') or {}
+
+        return {
+            "full_name": repository['nameWithOwner'],
+            "description": repository.get('description'),
+            "stars": repository['stargazerCount'],
+            "forks": repository['forkCount'],
+            "url": repository['url'],
+            "commit_count": history.get('totalCount'),
+        }
+
+    def get_repo_folder(self, owner: str, repo: str, path: str = "") -> List[GHContentObject]:
+        """
+        Retrieves the contents of a specific folder in a GitHub repository.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+            path (str): The folder path within the repository.
+
+        Returns:
+            List[GHContentObject]: List of content objects in the folder.
+        """
+        return self._run(self._get_repo_folder(owner, repo, path))
+
+    async def _get_repo_folder(self, owner: str, repo: str, path: str = "") -> List[GHContentObject]:
+        """
+        Retrieves the contents of a folder, fetching all pages after the first concurrently.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+            path (str): The folder path within the repository.
+
+        Returns:
+            List[GHContentObject]: List of content objects in the folder.
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/contents/{path}"
+
+        results = []
+
+        try:
+            _print_progress(f"Parsing page 1 of folder {path}")
+            fetched = await self._fetch(url, {"per_page": "100", "page": "1"}, f"{owner}/{repo}")
+            if fetched is None:
+                return []
+
+            data, response_headers = fetched
+            results.extend(GHContentObject(x) for x in data)
+
+            last_page = _last_page_from_link(response_headers.get('Link', ''))
+            if last_page > 1:
+                pages = await asyncio.gather(*[
+                    self._fetch(url, {"per_page": "100", "page": str(page)}, f"{owner}/{repo}")
+                    for page in range(2, last_page + 1)
+                ])
+                for fetched in pages:
+                    if fetched is not None:
+                        results.extend(GHContentObject(x) for x in fetched[0])
+            elif len(data) >= 100:
+                # Full first page but no Link header: page sequentially until a short page.
+                page = 2
+                while True:
+                    _print_progress(f"Parsing page {page} of folder {path}")
+                    fetched = await self._fetch(url, {"per_page": "100", "page": str(page)},
+                                                f"{owner}/{repo}")
+                    if fetched is None or len(fetched[0]) <= 0:
+                        break
+                    results.extend(GHContentObject(x) for x in fetched[0])
+                    page += 1
+        except Exception as e:
+            print()
+            print(f"An unhandled exception occurred: {e}")
+            print(traceback.format_exc())
+        return results
+
+    def get_repo_tree(self, owner: str, repo: str,
+                      ref: str = "HEAD") -> Union[Tuple[List[GHContentObject], dict], None]:
+        """
+        Retrieves the full file tree of a GitHub repository in a single request.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+            ref (str): The commit, branch, or tag to read the tree from.
+
+        Returns:
+            Union[Tuple[List[GHContentObject], dict], None]: List of root-level content
+            objects and a full-path index, or None if the tree could not be fetched or
+            was truncated by the API.
+        """
+        return self._run(self._get_repo_tree(owner, repo, ref))
+
+    async def _get_repo_tree(self, owner: str, repo: str,
+                             ref: str = "HEAD") -> Union[Tuple[List[GHContentObject], dict], None]:
+        """
+        Retrieves a repository's file tree via the Git Trees API with recursive=1.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+            ref (str): The commit, branch, or tag to read the tree from.
+
+        Returns:
+            Union[Tuple[List[GHContentObject], dict], None]: List of root-level content
+            objects and a full-path index, or None if the tree could not be fetched or
+            was truncated by the API.
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/git/trees/{ref}"
+
+        try:
+            _print_progress(f"Parsing tree of repo {owner}/{repo}")
+            fetched = await self._fetch(url, {"recursive": "1"}, f"{owner}/{repo}")
+            if fetched is None:
+                return None
+
+            data, _ = fetched
+            if data.get('truncated'):
+                # Tree too large for a single response; the caller falls back to
+                # walking the contents API directory by directory.
+                return None
+            return _build_content_tree(data['tree'])
+        except Exception as e:
+            print()
+            print(f"An unhandled exception occurred: {e}")
+            print(traceback.format_exc())
+            return None
+
+    def parse_repo_contents(self, owner: str, repo: str, path: str = "",
+                            parent_object: GHContentObject = None
+                            ) -> Tuple[List[GHContentObject], dict]:
+        """
+        Parses the contents of a GitHub repository, including nested directories.
+
+        Fetches the whole tree in one request via the Git Trees API where possible,
+        falling back to a recursive walk of the contents API for truncated trees.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+            path (str): The folder path to start parsing from.
+            parent_object (GHContentObject): The parent object for nested structures.
+
+        Returns:
+            Tuple[List[GHContentObject], dict]: List of all parsed content objects, and an
+            index mapping full path (e.g. "a/b/c.py") to its content object for O(1) lookup.
+        """
+        return self._run(self._parse_repo_contents_entry(owner, repo, path, parent_object))
+
+    async def _parse_repo_contents_entry(self, owner: str, repo: str, path: str = "",
+                                         parent_object: GHContentObject = None
+                                         ) -> Tuple[List[GHContentObject], dict]:
+        """
+        Async entry point for parse_repo_contents.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+            path (str): The folder path to start parsing from.
+            parent_object (GHContentObject): The parent object for nested structures.
+
+        Returns:
+            Tuple[List[GHContentObject], dict]: List of all parsed content objects and a
+            full-path index.
+        """
+        if path == "" and parent_object is None:
+            tree = await self._get_repo_tree(owner, repo)
+            if tree is not None:
+                return tree
+
+        index = {}
+        results = await self._parse_repo_contents(owner, repo, path, parent_object, index)
+        return results, index
+
+    async def _parse_repo_contents(self, owner: str, repo: str, path: str = "",
+                                   parent_object: GHContentObject = None,
+                                   index: dict = None) -> List[GHContentObject]:
+        """
+        Recursively parses repository contents, descending into subdirectories concurrently.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+            path (str): The folder path to start parsing from.
+            parent_object (GHContentObject): The parent object for nested structures.
+            index (dict): Optional full-path index populated with every parsed object.
+
+        Returns:
+            List[GHContentObject]: List of all parsed content objects.
+        """
+        results = []
+
+        folder_contents = await self._get_repo_folder(owner, repo, path)
+
+        if parent_object is None:
+            results.extend(folder_contents)
+        else:
+            parent_object.add_children(folder_contents)
+
+        if index is not None:
+            for content in folder_contents:
+                index[f"{path}/{content.name}" if path else content.name] = content
+
+        await asyncio.gather(*[
+            self._parse_repo_contents(owner, repo,
+                                      f"{path}/{content.name}" if path else content.name,
+                                      content, index)
+            for content in folder_contents if content.type == "dir"
+        ])
+
+        return results
+
+    def get_repo_info(self, owner: str, repo: str) -> Union[dict, None]:
+        """
+        Retrieves metadata about a specific GitHub repository.
+
+        Successful lookups are memoized for the life of the client, so asking for
+        the same repository again across menu actions costs no network round trip.
+        Failed lookups are not cached, so a transient error does not stick.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+
+        Returns:
+            Union[dict, None]: A dictionary containing repository metadata, or None if the repository is inaccessible.
+        """
+        key = (owner, repo)
+        cached = self._repo_info_cache.get(key)
+        if cached is not None:
+            return cached
+
+        info = self._run(self._get_repo_info(owner, repo))
+        if info is not None:
+            self._repo_info_cache[key] = info
+        return info
+
+    async def _get_repo_info(self, owner: str, repo: str) -> Union[dict, None]:
+        """
+        Retrieves repository metadata.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+
+        Returns:
+            Union[dict, None]: A dictionary containing repository metadata, or None if the repository is inaccessible.
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}"
+
+        print(f"Trying to get repo {owner}/{repo}...")
+
+        try:
+            fetched = await self._fetch(url, {}, f"{owner}/{repo}")
+            if fetched is None:
+                return None
+            return fetched[0]
+        except Exception as e:
+            print()
+            print(f"An unhandled exception occurred: {e}")
+            print(traceback.format_exc())
+
+    def get_repo_commits(self, owner: str, repo: str, starting_page: int) -> List[CommitSummary]:
+        """
+        Retrieves a list of commits from a GitHub repository.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+            starting_page (int): The page number to start retrieving commits from.
+
+        Returns:
+            List[CommitSummary]: One summary tuple per commit.
+        """
+        return self._run(self._get_repo_commits(owner, repo, starting_page))
+
+    async def _get_repo_commits(self, owner: str, repo: str, starting_page: int) -> List[CommitSummary]:
+        """
+        Retrieves repository commits, fetching all pages after the first concurrently.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The repository name.
+            starting_page (int): The page number to start retrieving commits from.
+
+        Returns:
+            List[CommitSummary]: One summary tuple per commit.
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/commits"
+
+        print(f"Trying to get commits of repo {owner}/{repo}...")
+
+        results = []
+
+        try:
+            _print_progress(f"Parsing page {starting_page}")
+            fetched = await self._fetch(url, {"per_page": "100", "page": str(starting_page)},
+                                        f"{owner}/{repo}")
+            if fetched is None:
+                return []
+
+            data, response_headers = fetched
+            if len(data) <= 0:
+                return results
+            results += _summarize_commits(data)
+
+            last_page = _last_page_from_link(response_headers.get('Link', ''))
+            if last_page > starting_page:
+                pages = await asyncio.gather(*[
+                    self._fetch(url, {"per_page": "100", "page": str(page)}, f"{owner}/{repo}")
+                    for page in range(starting_page + 1, last_page + 1)
+                ])
+                for fetched in pages:
+                    if fetched is not None:
+                        results += _summarize_commits(fetched[0])
+            elif len(data) >= 100:
+                # Full first page but no Link header: page sequentially until a short page.
+                page = starting_page + 1
+                while True:
+                    _print_progress(f"Parsing page {page}")
+                    fetched = await self._fetch(url, {"per_page": "100", "page": str(page)},
+                                                f"{owner}/{repo}")
+                    if fetched is None or len(fetched[0]) <= 0:
+                        break
+                    results += _summarize_commits(fetched[0])
+                    page += 1
+        except Exception as e:
+            print()
+            print(f"An unhandled exception occurred: {e}")
+            print(traceback.format_exc())
+        return results
+
+    def search_repos(self, keywords: List[str], starting_page: int = 1) -> List[RepoSummary]:
+        """
+        Searches for GitHub repositories based on a list of keywords.
+
+        Args:
+            keywords (List[str]): A list of keywords to search for.
+            starting_page (int): The page number to start the search from.
+
+        Returns:
+            List[RepoSummary]: One summary tuple per matching repository.
+        """
+        return self._run(self._search_repos(keywords, starting_page))
+
+    async def _search_repos(self, keywords: List[str], starting_page: int = 1) -> List[RepoSummary]:
+        """
+        Searches for repositories, paginating until total_count is exhausted.
+
+        Args:
+            keywords (List[str]): A list of keywords to search for.
+            starting_page (int): The page number to start the search from.
+
+        Returns:
+            List[RepoSummary]: One summary tuple per matching repository.
+        """
+        url = f"{self.base_url}/search/repositories"
+        params = {
+            "q": '+'.join(keywords),
+            "per_page": "100",
+            "page": starting_page
+        }
+        results = []
+
+        print(f"Starting search for keywords {', '.join(keywords)}")
+
+        max_page = 10  # The search API serves at most 1000 results (10 pages of 100)
+        while params['page'] <= max_page:
+            _print_progress(f"Parsing page {params['page']}/{max_page}...")
+            delay = PAGINATION_DELAY_SECONDS
+            try:
+                fetched = await self._fetch(url, {"q": params['q'], "per_page": "100",
+                                                  "page": str(params['page'])})
+                if fetched is None:
+                    break
+                data, response_headers = fetched
+                delay = _rate_limit_delay(response_headers)
+                # Stop as soon as total_count says there are no further pages.
+                max_page = min(10, -(-data['total_count'] // 100))
+                if len(data['items']) <= 0:
+                    break
+                results += _summarize_repos(data['items'])
+                params['page'] += 1
+            except Exception as e:
+                print()
+                print(f"An unhandled exception occurred: {e}")
+                print(traceback.format_exc())
+            await asyncio.sleep(delay)
+        print()
+
+        return results
@@ -2,9 +2,9 @@ import os
 from dotenv import load_dotenv
 from typing import List
 from github_api import (
-    search_repos,
-    get_repo_commits,
-    parse_repo_contents,
+    CommitSummary,
+    GitHubClient,
+    RepoSummary,
     print_content_tree
 )
 
@@ -20,19 +20,19 @@ def main_menu():
     return input("Choose an option (1-5): ")
 
 
-def display_repos(repos: List[dict]):
+def display_repos(repos: List[RepoSummary]):
     for idx, repo in enumerate(repos, start=1):
-        print(f"[{idx}] {repo['full_name']}")
+        print(f"[{idx}] {repo.full_name}")
 
 
-def display_commits(commits: List[dict]):
+def display_commits(commits: List[CommitSummary]):
     for idx, commit in enumerate(commits, start=1):
-        print(f"[{idx}] {commit['commit']['message']}")
+        print(f"[{idx}] {commit.message}")
 
 
-def handle_search_repos(api_version: str, token: str):
+def handle_search_repos(client: GitHubClient):
     keywords = input("Enter search keywords (space-separated): ").split()
-    repos = search_repos(keywords, api_version, token)
+    repos = client.search_repos(keywords)
 
     if not repos:
         print("\nNo repositories found.")
@@ -51,21 +51,32 @@ def handle_search_repos(api_version: str, token: str):
             repo_idx = int(selection) - 1
             if 0 <= repo_idx < len(repos):
                 repo = repos[repo_idx]
-                print(f"\nRepository: {repo['full_name']}")
-                print(f"Description: {repo.get('description', 'No description')}")
-                print(f"Stars: {repo['stargazers_count']}, Forks: {repo['forks_count']}")
-                print(f"URL: {repo['html_url']}")
+                owner_name, repo_name = repo.full_name.split('/', 1)
+                overview = client.get_repo_overview(owner_name, repo_name)
+                if overview:
+                    print(f"\nRepository: {overview['full_name']}")
+                    print(f"Description: {overview['description'] or 'No description'}")
+                    print(f"Stars: {overview['stars']}, Forks: {overview['forks']}")
+                    if overview['commit_count'] is not None:
+                        print(f"Commits: {overview['commit_count']}")
+                    print(f"URL: {overview['url']}")
+                else:
+                    # Fall back to the data already returned by the search
+                    print(f"\nRepository: {repo.full_name}")
+                    print(f"Description: {repo.description or 'No description'}")
+                    print(f"Stars: {repo.stars}, Forks: {repo.forks}")
+                    print(f"URL: {repo.html_url}")
             else:
                 print("Invalid selection. Please choose a valid number.")
         except ValueError:
             print("Invalid input. Please enter a number.")
 
 
-def handle_repo_commits(api_version: str, token: str):
+def handle_repo_commits(client: GitHubClient):
     owner = input("Enter repository owner: ")
     repo = input("Enter repository name: ")
     starting_page = int(input("Enter starting page number: "))
-    commits = get_repo_commits(owner, repo, api_version, token, starting_page)
+    commits = client.get_repo_commits(owner, repo, starting_page)
 
     if not commits:
         print("\nNo commits found.")
@@ -84,22 +95,22 @@ def handle_repo_commits(api_version: str, token: str):
             commit_idx = int(selection) - 1
             if 0 <= commit_idx < len(commits):
                 commit = commits[commit_idx]
-                print(f"\nCommit Message: {commit['commit']['message']}")
-                print(f"Author: {commit['commit']['author']['name']}")
-                print(f"Date: {commit['commit']['author']['date']}")
-                print(f"URL: {commit['html_url']}")
+                print(f"\nCommit Message: {commit.message}")
+                print(f"Author: {commit.author_name}")
+                print(f"Date: {commit.date}")
+                print(f"URL: {commit.html_url}")
             else:
                 print("Invalid selection. Please choose a valid number.")
         except ValueError:
             print("Invalid input. Please enter a number.")
 
 
-def handle_repo_contents(api_version: str, token: str):
+def handle_repo_contents(client: GitHubClient):
     owner = input("Enter repository owner: ")
     repo = input("Enter repository name: ")
 
     print("\nParsing repository contents...")
-    root_objects = parse_repo_contents(owner, repo, api_version, token)
+    root_objects, content_index = client.parse_repo_contents(owner, repo)
     print_content_tree(root_objects)
 
     while True:
@@ -107,17 +118,7 @@ def handle_repo_contents(api_version: str, token: str):
         if not path:
             break
 
-        # Search for the content in the tree
-        def find_content(objects, _path_parts):
-            for obj in objects:
-                if obj.name == _path_parts[0]:
-                    if len(_path_parts) == 1:
-                        return obj
-                    return find_content(obj.children, _path_parts[1:])
-            return None
-
-        path_parts = path.split("/")
-        content = find_content(root_objects, path_parts)
+        content = content_index.get(path.strip("/"))
 
         if content:
             print(f"\nName: {content.name}")
@@ -140,14 +141,16 @@ if __name__ == "__main__":
               "Make sure you have GITHUB_TOKEN set up in your environment!")
         exit(1)
 
+    github_client = GitHubClient(github_api_version, github_token)
+
     while True:
         choice = main_menu()
         if choice == "1":
-            handle_search_repos(github_api_version, github_token)
+            handle_search_repos(github_client)
         elif choice == "2":
-            handle_repo_commits(github_api_version, github_token)
+            handle_repo_commits(github_client)
         elif choice == "3":
-            handle_repo_contents(github_api_version, github_token)
+            handle_repo_contents(github_client)
         elif choice == "5":
             print("Exiting the application. Goodbye!")
             break